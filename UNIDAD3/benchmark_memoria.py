@@ -0,0 +1,123 @@
+import random
+import tracemalloc
+from typing import List, Tuple, Callable
+
+from Tarea2 import Particle, Swarm, sphere_function
+
+class ParticulaListas:
+    """Representación anterior de Particle: __dict__ y vectores como listas de float."""
+    def __init__(self, dimensions: int, bounds: Tuple[float, float], objective_function: Callable[[List[float]], float]):
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.objective_function = objective_function
+        self.position = [random.uniform(bounds[0], bounds[1]) for _ in range(dimensions)]
+        self.velocity = [random.uniform(-(bounds[1]-bounds[0]), (bounds[1]-bounds[0])) for _ in range(dimensions)]
+        self.best_position = self.position.copy()
+        self.best_value = objective_function(self.position)
+    
+    def update_velocity(self, global_best_position: List[float], w: float = 0.5, c1: float = 1.5, c2: float = 1.5):
+        for i in range(self.dimensions):
+            r1, r2 = random.random(), random.random()
+            cognitive = c1 * r1 * (self.best_position[i] - self.position[i])
+            social = c2 * r2 * (global_best_position[i] - self.position[i])
+            self.velocity[i] = w * self.velocity[i] + cognitive + social
+    
+    def update_position(self):
+        for i in range(self.dimensions):
+            self.position[i] += self.velocity[i]
+            if self.position[i] < self.bounds[0]:
+                self.position[i] = self.bounds[0]
+                self.velocity[i] *= -0.5
+            elif self.position[i] > self.bounds[1]:
+                self.position[i] = self.bounds[1]
+                self.velocity[i] *= -0.5
+        current_value = self.objective_function(self.position)
+        if current_value < self.best_value:
+            self.best_position = self.position.copy()
+            self.best_value = current_value
+
+class EnjambreListas:
+    """Bucle anterior de Swarm.optimize: copia la mejor posición global al mejorar."""
+    def __init__(self, num_particles: int, dimensions: int, bounds: Tuple[float, float]):
+        self.particles = [ParticulaListas(dimensions, bounds, sphere_function) for _ in range(num_particles)]
+        best = min(self.particles, key=lambda p: p.best_value)
+        self.global_best_position = best.best_position.copy()
+        self.global_best_value = best.best_value
+    
+    def iterate(self):
+        for particle in self.particles:
+            particle.update_velocity(self.global_best_position, 0.7, 1.5, 1.5)
+            particle.update_position()
+        for particle in self.particles:
+            if particle.best_value < self.global_best_value:
+                self.global_best_position = particle.best_position.copy()
+                self.global_best_value = particle.best_value
+
+def bytes_por_particula(factory: Callable[[], object], num_particles: int) -> float:
+    """Memoria retenida por partícula (en bytes) al crear num_particles partículas."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    particles = [factory() for _ in range(num_particles)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del particles
+    return (after - before) / num_particles
+
+def memoria_por_iteracion(crear: Callable[[], Callable[[], None]], iterations: int) -> Tuple[float, float, float]:
+    """
+    Mide la memoria de cada iteración del bucle de actualización tras calentarlo.
+    
+    Args:
+        crear: Construye el enjambre y devuelve la función que ejecuta una iteración.
+        iterations: Iteraciones medidas.
+    
+    Returns:
+        (pico transitorio máximo en bytes, pico transitorio medio en bytes,
+         bytes retenidos netos al final).
+    """
+    # Se traza desde la creación del enjambre para que los objetos que reemplaza
+    # el bucle también estén contabilizados al liberarse
+    tracemalloc.start()
+    iterate = crear()
+    for _ in range(5):
+        iterate()
+    inicio = tracemalloc.take_snapshot()
+    picos = []
+    for _ in range(iterations):
+        actual = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        iterate()
+        picos.append(tracemalloc.get_traced_memory()[1] - actual)
+    fin = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retenidos = sum(stat.size_diff for stat in fin.compare_to(inicio, "lineno")
+                    if stat.traceback[0].filename != tracemalloc.__file__)
+    return max(picos), sum(picos) / len(picos), retenidos
+
+if __name__ == "__main__":
+    random.seed(0)
+    num_particles = 100_000
+    bounds = (-5.0, 5.0)
+    
+    print("=== Memoria por partícula ===")
+    print(f"{'dimensiones':>12} {'antes (listas)':>16} {'después (slots+array)':>22} {'ahorro':>8}")
+    for dimensions in (3, 10, 30):
+        antes = bytes_por_particula(lambda: ParticulaListas(dimensions, bounds, sphere_function), num_particles)
+        despues = bytes_por_particula(lambda: Particle(dimensions, bounds, sphere_function), num_particles)
+        print(f"{dimensions:>12} {antes:>14.0f} B {despues:>20.0f} B {1 - despues / antes:>7.0%}")
+    
+    # Pico transitorio: memoria asignada por encima del punto de partida durante
+    # una iteración. Los float temporales de random.random(), de la aritmética
+    # y de la función objetivo se siguen creando en Python puro; sólo se
+    # reciclan de inmediato (evitarlos del todo requeriría NumPy).
+    print("\n=== Memoria por iteración (1000 partículas, 30 dimensiones, 50 iteraciones) ===")
+    print(f"{'representación':>16} {'pico máx.':>10} {'pico medio':>11} {'retenidos netos':>16}")
+    def crear_listas():
+        return EnjambreListas(1000, 30, bounds).iterate
+    def crear_slots():
+        swarm = Swarm(1000, 30, bounds, sphere_function)
+        # Mismo paso que ejecuta Swarm.optimize en cada iteración
+        return lambda: swarm._iterar(0.7, 1.5, 1.5)
+    for nombre, crear in (("antes (listas)", crear_listas), ("después (slots)", crear_slots)):
+        pico_max, pico_medio, retenidos = memoria_por_iteracion(crear, 50)
+        print(f"{nombre:>16} {pico_max:>8.0f} B {pico_medio:>9.0f} B {retenidos:>14} B")
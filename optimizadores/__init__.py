@@ -0,0 +1,7 @@
+"""Ejecutor unificado de los algoritmos de optimización del curso."""
+from .algoritmos import ALGORITMOS, cargar_modulo
+from .barrido import clasificar, ejecutar_barrido, expandir_rejilla
+from .cli import main, parsear_rejilla
+
+__all__ = ["ALGORITMOS", "cargar_modulo", "clasificar", "ejecutar_barrido",
+           "expandir_rejilla", "main", "parsear_rejilla"]
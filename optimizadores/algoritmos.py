@@ -0,0 +1,130 @@
+"""
+Registro de algoritmos del curso para el ejecutor unificado.
+
+Los scripts viven en carpetas con espacios y nombres que no son
+identificadores válidos (p. ej. ``8reynas.py``), así que se cargan por ruta.
+Cada adaptador recibe el problema y un diccionario de hiperparámetros y
+devuelve el costo de la mejor solución encontrada (menor es mejor).
+"""
+import importlib.util
+import math
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+MODULOS = {
+    "8reynas": RAIZ / "UNIDAD 2 TOPICOSIA" / "TAREA 2 UNIDAD 2" / "8reynas.py",
+    "recocido": RAIZ / "UNIDAD 2 TOPICOSIA" / "Tarea 3 TPIA" / "Tarea3.py",
+    "pso": RAIZ / "UNIDAD3" / "Tarea2.py",
+    "ga_tsp": RAIZ / "UNIDAD3" / "TAREA4" / "Tarea4.py",
+}
+
+_cargados: Dict[str, ModuleType] = {}
+
+def cargar_modulo(nombre: str) -> ModuleType:
+    """Importa (una sola vez por proceso) el script registrado con ese nombre."""
+    if nombre not in _cargados:
+        spec = importlib.util.spec_from_file_location(f"optimizadores._{nombre}", MODULOS[nombre])
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        _cargados[nombre] = modulo
+    return _cargados[nombre]
+
+def _tabu(problema: str, params: Dict[str, Any]) -> float:
+    _, conflictos = cargar_modulo("8reynas").busqueda_tabu(**params)
+    return conflictos
+
+def _recocido(problema: str, params: Dict[str, Any]) -> float:
+    _, ataques = cargar_modulo("recocido").recocido_simulado(**params)
+    return ataques
+
+_PSO_ENJAMBRE = ("num_particles", "dimensions", "max_iter", "topology", "num_informants", "rewire_patience")
+
+def _pso(problema: str, params: Dict[str, Any]) -> float:
+    modulo = cargar_modulo("pso")
+    funcion, limites = {
+        "sphere": (modulo.sphere_function, (-5.0, 5.0)),
+        "rastrigin": (modulo.rastrigin_function, (-5.12, 5.12)),
+    }[problema]
+    enjambre = {k: v for k, v in params.items() if k in _PSO_ENJAMBRE}
+    optimizacion = {k: v for k, v in params.items() if k not in _PSO_ENJAMBRE}
+    swarm = modulo.Swarm(
+        enjambre.pop("num_particles", 30),
+        enjambre.pop("dimensions", 10),
+        limites,
+        funcion,
+        **enjambre,
+    )
+    _, valor = swarm.optimize(**optimizacion)
+    return valor
+
+def _ga_tsp(problema: str, params: Dict[str, Any]) -> float:
+    modulo = cargar_modulo("ga_tsp")
+    ga = modulo.GA_TSP(modulo.distances, **params)
+    _, distancia = ga.run(verbose=False)
+    return float(distancia)
+
+# nombre -> (problemas disponibles, hiperparámetros aceptados, adaptador)
+ALGORITMOS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Callable[[str, Dict[str, Any]], float]]] = {
+    "tabu": (("8reinas",), ("max_iteraciones", "tabu_tamano"), _tabu),
+    "recocido": (("nreinas",), ("n_reinas", "temperatura_inicial", "enfriamiento", "iteraciones_por_temp"), _recocido),
+    "pso": (("sphere", "rastrigin"), _PSO_ENJAMBRE + ("w", "c1", "c2", "early_stopping"), _pso),
+    "ga_tsp": (("espana",), ("population_size", "generations", "mutation_rate", "crossover_rate"), _ga_tsp),
+}
+
+def _es_entero(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+def _es_real(v: Any) -> bool:
+    return (isinstance(v, (int, float)) and not isinstance(v, bool)) and math.isfinite(v)
+
+def _entero_positivo(v: Any) -> bool:
+    return _es_entero(v) and v > 0
+
+# hiperparámetro -> (condición, descripción). Los rangos evitan ejecuciones
+# que nunca terminan (p. ej. enfriamiento >= 1 en recocido_simulado).
+RESTRICCIONES: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    "max_iteraciones": (_entero_positivo, "entero > 0"),
+    "tabu_tamano": (_entero_positivo, "entero > 0"),
+    "n_reinas": (_entero_positivo, "entero > 0"),
+    "temperatura_inicial": (lambda v: _es_real(v) and v > 0, "real > 0"),
+    "enfriamiento": (lambda v: _es_real(v) and 0 < v < 1, "real en (0, 1)"),
+    "iteraciones_por_temp": (_entero_positivo, "entero > 0"),
+    "num_particles": (_entero_positivo, "entero > 0"),
+    "dimensions": (_entero_positivo, "entero > 0"),
+    "max_iter": (_entero_positivo, "entero > 0"),
+    "topology": (lambda v: v in cargar_modulo("pso").TOPOLOGIAS, "una de Tarea2.TOPOLOGIAS"),
+    "num_informants": (_entero_positivo, "entero > 0"),
+    "rewire_patience": (_entero_positivo, "entero > 0"),
+    "w": (_es_real, "real"),
+    "c1": (lambda v: _es_real(v) and v >= 0, "real >= 0"),
+    "c2": (lambda v: _es_real(v) and v >= 0, "real >= 0"),
+    "early_stopping": (lambda v: v is None or _entero_positivo(v), "entero > 0 o None"),
+    "population_size": (lambda v: _entero_positivo(v) and v % 2 == 0, "entero par > 0"),
+    "generations": (_entero_positivo, "entero > 0"),
+    "mutation_rate": (lambda v: _es_real(v) and 0 <= v <= 1, "real en [0, 1]"),
+    "crossover_rate": (lambda v: _es_real(v) and 0 <= v <= 1, "real en [0, 1]"),
+}
+
+# algoritmo -> script que carga su adaptador
+MODULO_DE_ALGORITMO = {"tabu": "8reynas", "recocido": "recocido", "pso": "pso", "ga_tsp": "ga_tsp"}
+
+def validar(algoritmo: str, problema: str, rejilla: Dict[str, Sequence[Any]]) -> None:
+    """Comprueba que el algoritmo, el problema y los hiperparámetros existan y estén en rango."""
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (opciones: {', '.join(ALGORITMOS)})")
+    problemas, aceptados, _ = ALGORITMOS[algoritmo]
+    if problema not in problemas:
+        raise ValueError(f"Problema {problema!r} no disponible para {algoritmo} (opciones: {', '.join(problemas)})")
+    desconocidos = [p for p in rejilla if p not in aceptados]
+    if desconocidos:
+        raise ValueError(f"Hiperparámetros no válidos para {algoritmo}: {', '.join(desconocidos)} "
+                         f"(opciones: {', '.join(aceptados)})")
+    for nombre, valores in rejilla.items():
+        condicion, descripcion = RESTRICCIONES[nombre]
+        invalidos = [v for v in valores if not condicion(v)]
+        if invalidos:
+            raise ValueError(f"Valores fuera de rango para {nombre}: "
+                             f"{', '.join(map(repr, invalidos))} (se espera {descripcion})")
@@ -0,0 +1,148 @@
+"""
+Barridos de hiperparámetros en paralelo con resultados en JSONL.
+
+Las tareas se generan de forma perezosa y sólo se mantienen en vuelo
+``2 * procesos`` a la vez, de modo que la memoria no crece con el tamaño
+de la rejilla. Cada resultado se escribe en cuanto termina.
+"""
+import itertools
+import json
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from .algoritmos import ALGORITMOS, MODULO_DE_ALGORITMO, cargar_modulo, validar
+
+Tarea = Tuple[int, str, str, Dict[str, Any], int]
+
+def expandir_rejilla(rejilla: Dict[str, Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    """Genera cada combinación de la rejilla como diccionario de hiperparámetros."""
+    nombres = list(rejilla)
+    for valores in itertools.product(*(rejilla[n] for n in nombres)):
+        yield dict(zip(nombres, valores))
+
+def ejecutar_tarea(tarea: Tarea) -> Dict[str, Any]:
+    """
+    Ejecuta una configuración con una semilla y mide su tiempo de CPU.
+    
+    El script del algoritmo se importa antes de iniciar el cronómetro para
+    que la primera tarea de cada proceso no pague el costo de importación.
+    
+    Args:
+        tarea: (id_config, algoritmo, problema, parámetros, semilla).
+        
+    Returns:
+        Registro listo para serializar en JSONL.
+    """
+    id_config, algoritmo, problema, params, semilla = tarea
+    registro = {"config": id_config, "algoritmo": algoritmo, "problema": problema,
+                "params": params, "semilla": semilla}
+    try:
+        cargar_modulo(MODULO_DE_ALGORITMO[algoritmo])
+    except Exception as e:
+        registro["error"] = f"{type(e).__name__}: {e}"
+        registro["cpu_s"] = 0.0
+        return registro
+    
+    random.seed(semilla)
+    inicio = time.process_time()
+    try:
+        registro["costo"] = ALGORITMOS[algoritmo][2](problema, dict(params))
+    except Exception as e:
+        registro["error"] = f"{type(e).__name__}: {e}"
+    registro["cpu_s"] = time.process_time() - inicio
+    return registro
+
+def _tareas(algoritmo: str, problema: str, rejilla: Dict[str, Sequence[Any]],
+            repeticiones: int, semilla: int) -> Iterator[Tarea]:
+    for id_config, params in enumerate(expandir_rejilla(rejilla)):
+        for r in range(repeticiones):
+            yield (id_config, algoritmo, problema, params, semilla + r)
+
+def ejecutar_barrido(algoritmo: str, problema: str, rejilla: Dict[str, Sequence[Any]],
+                     salida: str, repeticiones: int = 1, procesos: int = 1,
+                     semilla: int = 0) -> List[Dict[str, Any]]:
+    """
+    Ejecuta todas las combinaciones de la rejilla y las clasifica.
+    
+    Args:
+        algoritmo: Nombre registrado en ALGORITMOS.
+        problema: Instancia del problema para ese algoritmo.
+        rejilla: Hiperparámetro -> lista de valores a probar.
+        salida: Archivo JSONL donde se escribe cada ejecución al terminar.
+        repeticiones: Ejecuciones por configuración (semillas consecutivas).
+        procesos: Procesos de trabajo (1 ejecuta en el proceso actual).
+        semilla: Semilla de la primera repetición.
+        
+    Returns:
+        Ranking de configuraciones (ver ``clasificar``).
+    """
+    validar(algoritmo, problema, rejilla)
+    if repeticiones <= 0:
+        raise ValueError("El número de repeticiones debe ser > 0")
+    if procesos <= 0:
+        raise ValueError("El número de procesos debe ser > 0")
+    
+    resumen: Dict[int, Dict[str, Any]] = {}
+    tareas = _tareas(algoritmo, problema, rejilla, repeticiones, semilla)
+    
+    with open(salida, "w", encoding="utf-8") as archivo:
+        def registrar(registro: Dict[str, Any]):
+            archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            archivo.flush()
+            _acumular(resumen, registro)
+        
+        if procesos == 1:
+            for tarea in tareas:
+                registrar(ejecutar_tarea(tarea))
+        else:
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                en_vuelo = set()
+                for tarea in itertools.chain(tareas, [None]):
+                    if tarea is not None:
+                        en_vuelo.add(pool.submit(ejecutar_tarea, tarea))
+                    # Limitar tareas pendientes para acotar la memoria
+                    while en_vuelo and (tarea is None or len(en_vuelo) >= 2 * procesos):
+                        terminadas, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                        for futuro in terminadas:
+                            registrar(futuro.result())
+    
+    return clasificar(resumen)
+
+def _acumular(resumen: Dict[int, Dict[str, Any]], registro: Dict[str, Any]):
+    """Agrega una ejecución al resumen de su configuración."""
+    entrada = resumen.setdefault(registro["config"], {
+        "config": registro["config"], "params": registro["params"],
+        "ejecuciones": 0, "errores": 0, "costos": [], "cpu_s": 0.0,
+    })
+    entrada["cpu_s"] += registro["cpu_s"]
+    if "error" in registro:
+        entrada["errores"] += 1
+    else:
+        entrada["ejecuciones"] += 1
+        entrada["costos"].append(registro["costo"])
+
+def clasificar(resumen: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ordena las configuraciones por calidad por segundo de CPU.
+    
+    La calidad de una ejecución es 1 / (1 + costo), así que vale 1 en el
+    óptimo (costo 0) y tiende a 0 conforme empeora. Las configuraciones
+    sin ejecuciones válidas quedan al final.
+    """
+    ranking = []
+    for entrada in resumen.values():
+        costos = entrada["costos"]
+        fila = {"config": entrada["config"], "params": entrada["params"],
+                "ejecuciones": entrada["ejecuciones"], "errores": entrada["errores"],
+                "cpu_s": entrada["cpu_s"] / max(entrada["ejecuciones"] + entrada["errores"], 1)}
+        if costos:
+            calidad = sum(1 / (1 + c) for c in costos) / len(costos)
+            fila.update(costo_medio=sum(costos) / len(costos), mejor_costo=min(costos),
+                        calidad=calidad, calidad_por_cpu_s=calidad / max(fila["cpu_s"], 1e-9))
+        else:
+            fila.update(costo_medio=None, mejor_costo=None, calidad=None, calidad_por_cpu_s=None)
+        ranking.append(fila)
+    ranking.sort(key=lambda f: (f["calidad_por_cpu_s"] is None, -(f["calidad_por_cpu_s"] or 0)))
+    return ranking
@@ -0,0 +1,84 @@
+"""
+Línea de comandos del ejecutor unificado.
+
+Ejemplo:
+    python -m optimizadores pso --problema rastrigin \\
+        --param w=0.4,0.7 --param c1=1.5,2.0 --param c2=1.5,2.0 \\
+        --param topology=global,ring --repeticiones 5 --procesos 4 \\
+        --salida resultados.jsonl
+"""
+import argparse
+import ast
+import os
+from typing import Any, Dict, List, Optional
+
+from .algoritmos import ALGORITMOS
+from .barrido import ejecutar_barrido
+
+def _valor(texto: str) -> Any:
+    """
+    Convierte un valor de la línea de comandos en int, float, bool, None o str.
+    
+    Cualquier otro literal (conjuntos, complejos, listas...) se conserva como
+    texto para que el resultado siempre sea serializable en JSON.
+    """
+    try:
+        valor = ast.literal_eval(texto)
+    except (ValueError, SyntaxError):
+        return texto
+    if valor is None or isinstance(valor, (bool, int, float, str)):
+        return valor
+    return texto
+
+def parsear_rejilla(especificaciones: List[str]) -> Dict[str, List[Any]]:
+    """
+    Convierte entradas ``nombre=v1,v2,...`` en una rejilla de hiperparámetros.
+    
+    Args:
+        especificaciones: Valores de cada opción --param.
+        
+    Returns:
+        Hiperparámetro -> lista de valores.
+    """
+    rejilla: Dict[str, List[Any]] = {}
+    for especificacion in especificaciones:
+        nombre, sep, valores = especificacion.partition("=")
+        if not sep or not nombre or not valores:
+            raise ValueError(f"Formato inválido para --param: {especificacion!r} (use nombre=v1,v2,...)")
+        rejilla.setdefault(nombre.strip(), []).extend(_valor(v.strip()) for v in valores.split(","))
+    return rejilla
+
+def _formato(valor: Optional[float]) -> str:
+    return "-" if valor is None else f"{valor:.6g}"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m optimizadores",
+        description="Ejecuta barridos de hiperparámetros sobre los algoritmos del curso.")
+    parser.add_argument("algoritmo", choices=list(ALGORITMOS))
+    parser.add_argument("--problema", help="Instancia del problema (por defecto la primera disponible).")
+    parser.add_argument("--param", action="append", default=[], metavar="NOMBRE=V1,V2",
+                        help="Valores a probar de un hiperparámetro; se puede repetir.")
+    parser.add_argument("--repeticiones", type=int, default=1, help="Ejecuciones por configuración.")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1, help="Procesos de trabajo.")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de la primera repetición.")
+    parser.add_argument("--salida", default="resultados.jsonl", help="Archivo JSONL de resultados.")
+    parser.add_argument("--top", type=int, default=10, help="Configuraciones a mostrar en el ranking.")
+    args = parser.parse_args(argv)
+    
+    problema = args.problema or ALGORITMOS[args.algoritmo][0][0]
+    try:
+        rejilla = parsear_rejilla(args.param)
+        ranking = ejecutar_barrido(args.algoritmo, problema, rejilla, args.salida,
+                                   repeticiones=args.repeticiones, procesos=args.procesos,
+                                   semilla=args.semilla)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    print(f"Resultados en {args.salida}")
+    print(f"\n=== Ranking por calidad / segundo de CPU ({args.algoritmo}, {problema}) ===")
+    for posicion, fila in enumerate(ranking[:args.top], start=1):
+        print(f"{posicion:>3}. calidad/cpu_s={_formato(fila['calidad_por_cpu_s'])} "
+              f"costo_medio={_formato(fila['costo_medio'])} cpu_s={fila['cpu_s']:.4f} "
+              f"errores={fila['errores']} params={fila['params']}")
+    return 0